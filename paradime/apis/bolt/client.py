@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 
@@ -133,55 +133,46 @@ class BoltClient:
             variables={"offset": offset, "limit": limit, "showInactive": show_inactive},
         )["listBoltSchedules"]
 
-        schedules: List[BoltSchedule] = []
-        for schedule_json in response_json["schedules"]:
-            schedules.append(
-                BoltSchedule(
-                    name=schedule_json["name"],
-                    schedule=schedule_json["schedule"],
-                    owner=schedule_json["owner"],
-                    last_run_at=schedule_json["lastRunAt"],
-                    last_run_state=schedule_json["lastRunState"],
-                    next_run_at=schedule_json["nextRunAt"],
-                    id=schedule_json["id"],
-                    uuid=schedule_json["uuid"],
-                    source=schedule_json["source"],
-                    deferred_schedule=(
-                        BoltDeferredSchedule(
-                            enabled=schedule_json["deferredSchedule"]["enabled"],
-                            deferred_schedule_name=schedule_json["deferredSchedule"][
-                                "deferredScheduleName"
-                            ],
-                            successful_run_only=schedule_json["deferredSchedule"][
-                                "successfulRunOnly"
-                            ],
-                        )
-                        if schedule_json["deferredSchedule"]
-                        else None
-                    ),
-                    turbo_ci=(
-                        BoltDeferredSchedule(
-                            enabled=schedule_json["turboCi"]["enabled"],
-                            deferred_schedule_name=schedule_json["turboCi"]["deferredScheduleName"],
-                            successful_run_only=schedule_json["turboCi"]["successfulRunOnly"],
-                        )
-                        if schedule_json["turboCi"]
-                        else None
-                    ),
-                    commands=schedule_json["commands"],
-                    git_branch=schedule_json["gitBranch"],
-                    slack_on=schedule_json["slackOn"],
-                    slack_notify=schedule_json["slackNotify"],
-                    email_on=schedule_json["emailOn"],
-                    email_notify=schedule_json["emailNotify"],
-                )
+        schedules = [
+            BoltSchedule(
+                name=schedule_json["name"],
+                schedule=schedule_json["schedule"],
+                owner=schedule_json["owner"],
+                last_run_at=schedule_json["lastRunAt"],
+                last_run_state=schedule_json["lastRunState"],
+                next_run_at=schedule_json["nextRunAt"],
+                id=schedule_json["id"],
+                uuid=schedule_json["uuid"],
+                source=schedule_json["source"],
+                deferred_schedule=self._parse_deferred_schedule(schedule_json["deferredSchedule"]),
+                turbo_ci=self._parse_deferred_schedule(schedule_json["turboCi"]),
+                commands=schedule_json["commands"],
+                git_branch=schedule_json["gitBranch"],
+                slack_on=schedule_json["slackOn"],
+                slack_notify=schedule_json["slackNotify"],
+                email_on=schedule_json["emailOn"],
+                email_notify=schedule_json["emailNotify"],
             )
+            for schedule_json in response_json["schedules"]
+        ]
 
         return BoltSchedules(
             schedules=schedules,
             total_count=response_json["totalCount"],
         )
 
+    def _parse_deferred_schedule(
+        self, deferred_schedule_json: Optional[Dict[str, Any]]
+    ) -> Optional[BoltDeferredSchedule]:
+        if not deferred_schedule_json:
+            return None
+
+        return BoltDeferredSchedule(
+            enabled=deferred_schedule_json["enabled"],
+            deferred_schedule_name=deferred_schedule_json["deferredScheduleName"],
+            successful_run_only=deferred_schedule_json["successfulRunOnly"],
+        )
+
     def get_schedule(self, schedule_name: str) -> BoltScheduleInfo:
         """
         Retrieves information about a specific schedule.
@@ -277,19 +268,18 @@ class BoltClient:
             "boltRunStatus"
         ]
 
-        commands: List[BoltCommand] = []
-        for command_json in response_json["commands"]:
-            commands.append(
-                BoltCommand(
-                    id=command_json["id"],
-                    command=command_json["command"],
-                    start_dttm=command_json["startDttm"],
-                    end_dttm=command_json["endDttm"],
-                    stdout=command_json["stdout"],
-                    stderr=command_json["stderr"],
-                    return_code=command_json["returnCode"],
-                )
+        commands = [
+            BoltCommand(
+                id=command_json["id"],
+                command=command_json["command"],
+                start_dttm=command_json["startDttm"],
+                end_dttm=command_json["endDttm"],
+                stdout=command_json["stdout"],
+                stderr=command_json["stderr"],
+                return_code=command_json["returnCode"],
             )
+            for command_json in response_json["commands"]
+        ]
 
         return sorted(commands, key=lambda command: command.id)
 
@@ -319,14 +309,13 @@ class BoltClient:
             query=query, variables={"commandId": int(command_id)}
         )["boltCommand"]
 
-        artifacts: List[BoltCommandArtifact] = []
-        for artifact_json in response_json["resources"]:
-            artifacts.append(
-                BoltCommandArtifact(
-                    id=artifact_json["id"],
-                    path=artifact_json["path"],
-                )
+        artifacts = [
+            BoltCommandArtifact(
+                id=artifact_json["id"],
+                path=artifact_json["path"],
             )
+            for artifact_json in response_json["resources"]
+        ]
 
         return artifacts
 
@@ -405,7 +394,7 @@ class BoltClient:
         if command_index is not None:
             commands_to_look = [all_commands[command_index]]
 
-        # Find the artifact
+        # Find the artifact, stopping at the first command that produced it
         artifact_id = None
         for command in commands_to_look:
             artifacts = self.list_command_artifacts(command.id)
@@ -413,6 +402,8 @@ class BoltClient:
                 if artifact.path == artifact_path:
                     artifact_id = artifact.id
                     break
+            if artifact_id is not None:
+                break
         if artifact_id is None:
             raise BoltScheduleArtifactNotFoundException(
                 f"No artifact found for schedule {schedule_name!r} and run id {latest_run_id}."
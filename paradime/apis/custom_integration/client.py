@@ -1,4 +1,5 @@
-from typing import List, Optional
+import math
+from typing import Any, Dict, List, Optional
 
 from paradime.apis.custom_integration.types import (
     Integration,
@@ -299,16 +300,22 @@ class CustomIntegrationClient:
             }
         """
 
+        # split the nodes by kind in a single pass
+        chart_like_nodes: List[Dict[str, Any]] = []
+        dashboard_like_nodes: List[Dict[str, Any]] = []
+        datasource_like_nodes: List[Dict[str, Any]] = []
+        for node in nodes:
+            if isinstance(node, NodeChartLike):
+                chart_like_nodes.append(node._to_gql_dict())
+            elif isinstance(node, NodeDashboardLike):
+                dashboard_like_nodes.append(node._to_gql_dict())
+            elif isinstance(node, NodeDatasourceLike):
+                datasource_like_nodes.append(node._to_gql_dict())
+
         variables = {
-            "chartLikeNodes": [
-                node._to_gql_dict() for node in nodes if isinstance(node, NodeChartLike)
-            ],
-            "dashboardLikeNodes": [
-                node._to_gql_dict() for node in nodes if isinstance(node, NodeDashboardLike)
-            ],
-            "datasourceLikeNodes": [
-                node._to_gql_dict() for node in nodes if isinstance(node, NodeDatasourceLike)
-            ],
+            "chartLikeNodes": chart_like_nodes,
+            "dashboardLikeNodes": dashboard_like_nodes,
+            "datasourceLikeNodes": datasource_like_nodes,
             "integrationUid": integration_uid,
             "snapshotHasMoreNodes": snapshot_has_more_nodes,
             "snapshotId": snapshot_id,
@@ -334,7 +341,8 @@ class CustomIntegrationClient:
             nodes (List[Node]): The list of all nodes to be added to the integration.
         """
         num_nodes_per_request = 10
-        num_of_requests = len(nodes) // num_nodes_per_request + 1
+        # always send at least one request so that an empty snapshot is still created
+        num_of_requests = max(math.ceil(len(nodes) / num_nodes_per_request), 1)
 
         snapshot_id = None
 
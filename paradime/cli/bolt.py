@@ -21,6 +21,7 @@ from paradime.client.paradime_cli_client import get_cli_client_or_exit
 from paradime.core.bolt.schedule import SCHEDULE_FILE_NAME, is_valid_schedule_at_path
 
 WAIT_SLEEP: Final = 10
+DOWNLOAD_CHUNK_SIZE: Final = 1024 * 1024
 
 
 @click.command()
@@ -188,7 +189,10 @@ def artifact(
         else:
             output_file_path = Path(output_path)
 
-        output_file_path.write_text(requests.get(artifact_url).text)
+        with requests.get(artifact_url, stream=True) as response:
+            with output_file_path.open("wb") as output_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    output_file.write(chunk)
 
         print_artifact_downloaded(output_file_path)
     except ParadimeException as e:
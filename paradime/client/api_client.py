@@ -29,6 +29,8 @@ class APIClient:
         self.api_secret = api_secret
         self.api_endpoint = api_endpoint
         self.timeout = timeout
+        # reuse the underlying connection across API requests
+        self._session = requests.Session()
 
     def _get_request_headers(self) -> Dict[str, str]:
         """
@@ -45,18 +47,17 @@ class APIClient:
             "X-PYTHON-SDK-VERSION": get_sdk_version(),
         }
 
-    def _raise_for_gql_response_body_errors(self, response: requests.Response) -> None:
+    def _raise_for_gql_response_body_errors(self, response_json: Dict[str, Any]) -> None:
         """
         Raise an exception for GraphQL response body errors.
 
         Args:
-            response (requests.Response): The API response.
+            response_json (dict): The decoded API response body.
 
         Raises:
             ParadimeAPIException: If there are errors in the response body.
         """
 
-        response_json = response.json()
         if "errors" in response_json:
             error_message = self._get_error_message_from_response(response_json)
             raise ParadimeAPIException(error_message)
@@ -83,19 +84,25 @@ class APIClient:
         except Exception as e:
             raise ParadimeAPIException(f"Error: {response.status_code} - {response.text}") from e
 
-    def _raise_for_errors(self, response: requests.Response) -> None:
+    def _raise_for_errors(self, response: requests.Response) -> Dict[str, Any]:
         """
         Raise an exception for any errors in the API response.
 
         Args:
             response (requests.Response): The API response.
 
+        Returns:
+            dict: The decoded API response body.
+
         Raises:
             ParadimeAPIException: If there are errors in the API response.
         """
 
         self._raise_for_response_status_errors(response)
-        self._raise_for_gql_response_body_errors(response)
+        response_json = response.json()
+        self._raise_for_gql_response_body_errors(response_json)
+
+        return response_json
 
     def _call_gql(self, query: str, variables: Dict[str, Any] = {}) -> Dict[str, Any]:
         """
@@ -112,12 +119,12 @@ class APIClient:
             ParadimeAPIException: If there are errors in the API response.
         """
 
-        response = requests.post(
+        response = self._session.post(
             url=self.api_endpoint,
             json={"query": query, "variables": variables},
             headers=self._get_request_headers(),
             timeout=self.timeout,
         )
-        self._raise_for_errors(response)
+        response_json = self._raise_for_errors(response)
 
-        return response.json()["data"]
+        return response_json["data"]
@@ -151,7 +151,8 @@ def is_valid_schedule_at_path(file_path: Path) -> Optional[str]:
 
     # check no duplicate schedule names
     schedule_names = [schedule.name for schedule in schedules.schedules]
-    if len(schedule_names) > len(set(schedule_names)):
+    unique_schedule_names = set(schedule_names)
+    if len(schedule_names) > len(unique_schedule_names):
         return "Schedule names are not unique."
 
     # check only one turbo ci config
@@ -163,11 +164,11 @@ def is_valid_schedule_at_path(file_path: Path) -> Optional[str]:
             else:
                 found_turbo_ci = True
 
-            if schedule.turbo_ci.deferred_schedule_name not in schedule_names:
+            if schedule.turbo_ci.deferred_schedule_name not in unique_schedule_names:
                 return f"Turbo CI schedule error: '{schedule.turbo_ci.deferred_schedule_name}' does not refer to another schedule name"
 
         if schedule.deferred_schedule and schedule.deferred_schedule.enabled:
-            if schedule.deferred_schedule.deferred_schedule_name not in schedule_names:
+            if schedule.deferred_schedule.deferred_schedule_name not in unique_schedule_names:
                 return f"Deferred schedule error: '{schedule.deferred_schedule.deferred_schedule_name}' does not refer to another schedule name"
 
     # Verify schedules individually
@@ -195,18 +196,12 @@ def verify_single_schedule(schedule: ParadimeSchedule) -> Optional[str]:
 
     # verify 'on' events
     for slack_on in schedule.slack_on:
-        if slack_on != "":
-            if slack_on not in VALID_ON_EVENTS:
-                return (
-                    f"{schedule_name}: Slack on '{slack_on}' is not valid - use: {VALID_ON_EVENTS}."
-                )
+        if slack_on and slack_on not in VALID_ON_EVENTS:
+            return f"{schedule_name}: Slack on '{slack_on}' is not valid - use: {VALID_ON_EVENTS}."
 
     for email_on in schedule.email_on:
-        if email_on != "":
-            if email_on not in VALID_ON_EVENTS:
-                return (
-                    f"{schedule_name}: Email on '{email_on}' is not valid - use: {VALID_ON_EVENTS}."
-                )
+        if email_on and email_on not in VALID_ON_EVENTS:
+            return f"{schedule_name}: Email on '{email_on}' is not valid - use: {VALID_ON_EVENTS}."
 
     return None
 
@@ -105,9 +105,10 @@ def get_power_bi_datasets(
         raise ValueError(f"Invalid response from datasets list: {datasets_response.text}")
     datasets = {}
     for dataset in response_json["value"]:
-        datasets[dataset.get("name")] = Dataset(
+        dataset_name = dataset.get("name")
+        datasets[dataset_name] = Dataset(
             id=dataset.get("id"),
-            name=dataset.get("name"),
+            name=dataset_name,
             is_refreshable=dataset.get("isRefreshable"),
         )
     return datasets
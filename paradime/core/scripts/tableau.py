@@ -29,8 +29,9 @@ def trigger_tableau_refresh(
     handle_http_error(auth_response)
 
     # Extract token to use for subsequent calls
-    auth_token: str = auth_response.json()["credentials"]["token"]
-    site_id: str = auth_response.json()["credentials"]["site"]["id"]
+    auth_credentials = auth_response.json()["credentials"]
+    auth_token: str = auth_credentials["token"]
+    site_id: str = auth_credentials["site"]["id"]
 
     # call refresh for the workbooks async
     futures = []
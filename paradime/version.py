@@ -1,19 +1,21 @@
+import importlib.metadata
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
 def get_sdk_version() -> str:
     """
-    Get the version of the Paradime SDK.
+    Get the version of the Paradime SDK. The result is cached as the installed version
+    cannot change during the lifetime of the process.
 
     Returns:
         str: The version of the Paradime SDK.
     """
 
     try:
-        import importlib.metadata
-
         return importlib.metadata.version("paradime-io")
     except Exception as e:
         logger.error(e)